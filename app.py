@@ -1,30 +1,120 @@
 import os
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import dash
-from dash import dcc, html, Input, Output, State, dash_table, callback_context
+from dash import dcc, html, Input, Output, State, Patch, dash_table, callback_context
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
 from datetime import datetime, timedelta
 import base64
 import io
 
-# Initialize the Dash app with Bootstrap theme
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+# Initialize the Dash app with Bootstrap theme, CDN-hosted JS bundles and gzip responses
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], serve_locally=False, compress=True)
 server = app.server
 
+# Shared cache for filter results (filesystem so all gunicorn workers can reuse it)
+cache = Cache(server, config={
+    'CACHE_TYPE': 'filesystem',
+    'CACHE_DIR': '/tmp/dash-cache',
+    'CACHE_DEFAULT_TIMEOUT': 300
+})
+
+# Low-cardinality text columns stored as categoricals (filtered and counted on every callback)
+CATEGORY_COLUMNS = [
+    'Industry Type', 'Shipment Requirement', 'Product / Commodity Type', 'Priority Level',
+    'Customer Type', 'Designation', 'Source Location / Country', 'Destination Location / Country', 'Status'
+]
+
+# Date columns parsed while reading the CSV
+DATE_COLUMNS = ['Date of Inquiry', 'Expected Ship Date', 'Follow Up Date']
+
+# Column types fixed up front, since the streaming CSV reader infers types from the first block only
+CSV_COLUMN_TYPES = {
+    'Customer ID': pa.string(),
+    **{col: pa.string() for col in CATEGORY_COLUMNS},
+    **{col: pa.timestamp('ns') for col in DATE_COLUMNS}
+}
+
+# The CSV is read in blocks of this many bytes
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Source CSV and its Parquet sidecar (typed columnar copy reused on later startups)
+DATA_PATH = 'data/leads.csv'
+PARQUET_PATH = 'data/leads.parquet'
+
+# Sidecar format version, stored in the Parquet metadata; bump it whenever the load pipeline
+# changes what the sidecar holds (dtypes, category order, row order) so older sidecars are rebuilt
+PARQUET_FORMAT_VERSION = b'1'
+
+# Helper function to check that the sidecar is newer than the CSV and was written by this load pipeline
+def sidecar_is_current():
+    if not os.path.exists(PARQUET_PATH) or os.path.getmtime(PARQUET_PATH) < os.path.getmtime(DATA_PATH):
+        return False
+    try:
+        metadata = pq.read_schema(PARQUET_PATH).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return metadata.get(b'leads_format_version') == PARQUET_FORMAT_VERSION
+
 # Load the enhanced customer data
 try:
-    df = pd.read_csv('data/leads.csv')
-    df['Date of Inquiry'] = pd.to_datetime(df['Date of Inquiry'])
-    df['Expected Ship Date'] = pd.to_datetime(df['Expected Ship Date'])
-    df['Follow Up Date'] = pd.to_datetime(df['Follow Up Date'])
-    print(f"Loaded {len(df)} comprehensive customer records from data/leads.csv")
+    df = None
+    if sidecar_is_current():
+        # A sidecar whose body cannot be read is rebuilt from the CSV below
+        try:
+            df = pd.read_parquet(PARQUET_PATH)
+        except (OSError, pa.ArrowInvalid) as e:
+            print(f"Warning: could not read {PARQUET_PATH}, rebuilding it from {DATA_PATH}: {e}")
+        else:
+            # The date filter binary-searches the rows, so restore date order if the sidecar lost it
+            if not df['Date of Inquiry'].is_monotonic_increasing:
+                df = df.sort_values('Date of Inquiry', kind='stable', ignore_index=True)
+            print(f"Loaded {len(df)} comprehensive customer records from {PARQUET_PATH}")
+    if df is None:
+        # Stream the CSV in blocks into compact Arrow buffers, then convert once with the
+        # category columns dictionary-encoded directly (no full-size object-string intermediate)
+        try:
+            table = pa_csv.open_csv(
+                DATA_PATH,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pa_csv.ConvertOptions(column_types=CSV_COLUMN_TYPES)
+            ).read_all()
+        except pa.ArrowInvalid as e:
+            # A later block disagreed with the types guessed for the unpinned columns; the one-pass
+            # table reader widens column types across blocks instead (as read_csv did before)
+            print(f"Warning: streaming read of {DATA_PATH} failed, reading it in one pass: {e}")
+            table = pa_csv.read_csv(DATA_PATH, convert_options=pa_csv.ConvertOptions(column_types=CSV_COLUMN_TYPES))
+        df = table.to_pandas(categories=CATEGORY_COLUMNS, split_blocks=True, self_destruct=True)
+        del table
+        # Arrow keeps categories in order of appearance; sort them once here so the dropdowns can list them as-is
+        for col in CATEGORY_COLUMNS:
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+        # Order rows by inquiry date so date ranges can be located by binary search (the sidecar keeps this order)
+        df = df.sort_values('Date of Inquiry', kind='stable', ignore_index=True)
+        print(f"Loaded {len(df)} comprehensive customer records from {DATA_PATH}")
+        # Write the sidecar under a temporary name first so other workers never read a partial file
+        try:
+            tmp_path = f"{PARQUET_PATH}.{os.getpid()}.tmp"
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**table.schema.metadata, b'leads_format_version': PARQUET_FORMAT_VERSION})
+            pq.write_table(table, tmp_path, compression='zstd')
+            del table
+            os.replace(tmp_path, PARQUET_PATH)
+        except OSError as e:
+            print(f"Warning: could not write {PARQUET_PATH}: {e}")
 except FileNotFoundError:
     print("Error: data/leads.csv not found. Please ensure the data file exists.")
     df = pd.DataFrame()
 
+# Drop filter results cached against a previous copy of the data
+cache.clear()
+
 # Define color scheme
 COLORS = {
     'primary': '#1f4e79',  # Dark blue
@@ -37,21 +127,110 @@ COLORS = {
     'dark': '#343a40'
 }
 
-# Helper function to categorize rates
-def categorize_rate(rate):
-    if rate >= 3000:
-        return 'High Value'
-    elif rate >= 1500:
-        return 'Medium Value'
-    else:
-        return 'Low Value'
+# Shared chart layouts, reused by every figure instead of per-figure update_layout calls
+CHART_LAYOUT = go.Layout(
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    margin=dict(l=20, r=20, t=20, b=20)
+)
+CHART_LAYOUT_NO_LEGEND = go.Layout(CHART_LAYOUT, showlegend=False)
+RATE_CHART_LAYOUT = go.Layout(
+    CHART_LAYOUT_NO_LEGEND,
+    barmode='relative',
+    xaxis_title_text='Rate / Quote Requested ($)',
+    yaxis_title_text='count'
+)
+DISTANCE_CHART_LAYOUT = go.Layout(
+    CHART_LAYOUT,
+    boxmode='group',
+    xaxis_title_text='Industry Type',
+    yaxis_title_text='Distance to be Covered (Km)',
+    legend_title_text='Priority Level'
+)
+TIMELINE_CHART_LAYOUT = go.Layout(CHART_LAYOUT, xaxis_title_text='Date', yaxis_title_text='Count')
 
-# Add rate category to dataframe
+# Rate category colors for the rate chart
+RATE_CATEGORY_COLORS = {'High Value': '#28a745', 'Medium Value': '#ffc107', 'Low Value': '#dc3545'}
+
+# Range filters only move values within the existing chart categories, so their
+# changes can be sent to single-trace charts as partial (Patch) updates
+RANGE_FILTER_IDS = {'rate-range-filter', 'date-range-filter'}
+
+# Columns summarized by the count charts
+COUNT_COLUMNS = ['Source Location / Country', 'Shipment Requirement', 'Industry Type', 'Product / Commodity Type']
+
+# Add rate category to dataframe (bins are closed on the left: >= 1500 is Medium, >= 3000 is High)
+if not df.empty:
+    df['Rate Category'] = pd.cut(
+        df['Rate / Quote Requested ($)'],
+        bins=[-np.inf, 1500, 3000, np.inf],
+        labels=['Low Value', 'Medium Value', 'High Value'],
+        right=False
+    )
+
+# Columns behind the dropdown filters, in filter_index argument order
+FILTER_COLUMNS = [
+    'Industry Type', 'Shipment Requirement', 'Product / Commodity Type', 'Priority Level',
+    'Customer Type', 'Designation', 'Source Location / Country', 'Destination Location / Country'
+]
+
+# Raw column arrays reused by the filter masks
 if not df.empty:
-    df['Rate Category'] = df['Rate / Quote Requested ($)'].apply(categorize_rate)
+    RATES = df['Rate / Quote Requested ($)'].values
+    INQUIRY_DATES = df['Date of Inquiry'].values.astype('datetime64[ns]')  # sorted ascending
+    # Fixed rate histogram bins over the full data range (40 bins)
+    RATE_BIN_EDGES = np.histogram_bin_edges(RATES, bins=40)
+
+# Category codes behind the High Priority and Conversion Rate KPIs
+if not df.empty:
+    HIGH_PRIORITY_CODES = [code for code, value in enumerate(df['Priority Level'].cat.categories) if value in ('High', 'Urgent')]
+    CONVERTED_STATUS_CODES = [code for code, value in enumerate(df['Status'].cat.categories) if value in ('Closed Won', 'Negotiating')]
+
+# Packed row bitmap (8 rows per byte) for every dropdown value, so each dropdown
+# filter is a bytewise AND instead of a comparison over every row
+FILTER_BITMAPS = {}
+if not df.empty:
+    for col in FILTER_COLUMNS:
+        codes = df[col].cat.codes.values
+        for code, value in enumerate(df[col].cat.categories):
+            FILTER_BITMAPS[(col, value)] = np.packbits(codes == code)
+
+# Helper function to build dropdown options from a categorical column (categories are sorted at load)
+def build_options(column, all_label):
+    options = [{'label': all_label, 'value': 'All'}]
+    if not df.empty:
+        options += [{'label': value, 'value': value} for value in df[column].cat.categories]
+    return options
+
+# Columns shown in the customer table (every row is sent once; the browser shows the ones listed in 'filtered-positions')
+TABLE_COLUMNS = [
+    'Customer ID', 'Company Name', 'Contact Person Name', 'Email', 'Phone',
+    'Shipment Requirement', 'Product / Commodity Type', 'Industry Type',
+    'Customer Type', 'Designation', 'Source Location / Country', 'Destination Location / Country',
+    'Distance to be Covered (Km)', 'Rate / Quote Requested ($)',
+    'Date of Inquiry', 'Priority Level', 'Status'
+]
+
+# Table rows as records, converted by Arrow in C++ rather than one Python dict per row in pandas
+TABLE_RECORDS = pa.Table.from_pandas(df[TABLE_COLUMNS], preserve_index=False).to_pylist() if not df.empty else []
+
+# Dropdown options, computed once at startup
+INDUSTRY_OPTIONS = build_options('Industry Type', 'All Industries')
+SHIPMENT_OPTIONS = build_options('Shipment Requirement', 'All Types')
+COMMODITY_OPTIONS = build_options('Product / Commodity Type', 'All Commodities')
+PRIORITY_OPTIONS = build_options('Priority Level', 'All Priorities')
+CUSTOMER_TYPE_OPTIONS = build_options('Customer Type', 'All Types')
+DESIGNATION_OPTIONS = build_options('Designation', 'All Designations')
+SOURCE_COUNTRY_OPTIONS = build_options('Source Location / Country', 'All Countries')
+DESTINATION_COUNTRY_OPTIONS = build_options('Destination Location / Country', 'All Countries')
 
 # Define the enhanced layout
 app.layout = dbc.Container([
+    # Full table data, sent once and filtered in the browser
+    dcc.Store(id='full-data', data=TABLE_RECORDS),
+    # Row positions matching the current filters, written by the dashboard callback (None when every row matches)
+    dcc.Store(id='filtered-positions'),
+    
     # Header Section
     dbc.Row([
         dbc.Col([
@@ -81,9 +260,9 @@ app.layout = dbc.Container([
                             html.Label("Industry Type:", className="form-label"),
                             dcc.Dropdown(
                                 id='industry-filter',
-                                options=[{'label': 'All Industries', 'value': 'All'}] + 
-                                       [{'label': industry, 'value': industry} for industry in sorted(df['Industry Type'].unique()) if not df.empty],
+                                options=INDUSTRY_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2),
@@ -91,9 +270,9 @@ app.layout = dbc.Container([
                             html.Label("Shipment Requirement:", className="form-label"),
                             dcc.Dropdown(
                                 id='shipment-filter',
-                                options=[{'label': 'All Types', 'value': 'All'}] + 
-                                       [{'label': req, 'value': req} for req in sorted(df['Shipment Requirement'].unique()) if not df.empty],
+                                options=SHIPMENT_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2),
@@ -101,9 +280,9 @@ app.layout = dbc.Container([
                             html.Label("Commodity Type:", className="form-label"),
                             dcc.Dropdown(
                                 id='commodity-filter',
-                                options=[{'label': 'All Commodities', 'value': 'All'}] + 
-                                       [{'label': commodity, 'value': commodity} for commodity in sorted(df['Product / Commodity Type'].unique()) if not df.empty],
+                                options=COMMODITY_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2),
@@ -111,9 +290,9 @@ app.layout = dbc.Container([
                             html.Label("Priority Level:", className="form-label"),
                             dcc.Dropdown(
                                 id='priority-filter',
-                                options=[{'label': 'All Priorities', 'value': 'All'}] + 
-                                       [{'label': priority, 'value': priority} for priority in sorted(df['Priority Level'].unique()) if not df.empty],
+                                options=PRIORITY_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2),
@@ -121,9 +300,9 @@ app.layout = dbc.Container([
                             html.Label("Customer Type:", className="form-label"),
                             dcc.Dropdown(
                                 id='customer-type-filter',
-                                options=[{'label': 'All Types', 'value': 'All'}] + 
-                                       [{'label': customer_type, 'value': customer_type} for customer_type in sorted(df['Customer Type'].unique()) if not df.empty],
+                                options=CUSTOMER_TYPE_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2),
@@ -131,9 +310,9 @@ app.layout = dbc.Container([
                             html.Label("Designation:", className="form-label"),
                             dcc.Dropdown(
                                 id='designation-filter',
-                                options=[{'label': 'All Designations', 'value': 'All'}] + 
-                                       [{'label': designation, 'value': designation} for designation in sorted(df['Designation'].unique()) if not df.empty],
+                                options=DESIGNATION_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=2)
@@ -143,9 +322,9 @@ app.layout = dbc.Container([
                             html.Label("Source Country:", className="form-label"),
                             dcc.Dropdown(
                                 id='source-country-filter',
-                                options=[{'label': 'All Countries', 'value': 'All'}] + 
-                                       [{'label': country, 'value': country} for country in sorted(df['Source Location / Country'].unique()) if not df.empty],
+                                options=SOURCE_COUNTRY_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=4),
@@ -153,9 +332,9 @@ app.layout = dbc.Container([
                             html.Label("Destination Country:", className="form-label"),
                             dcc.Dropdown(
                                 id='destination-country-filter',
-                                options=[{'label': 'All Countries', 'value': 'All'}] + 
-                                       [{'label': country, 'value': country} for country in sorted(df['Destination Location / Country'].unique()) if not df.empty],
+                                options=DESTINATION_COUNTRY_OPTIONS,
                                 value='All',
+                                persistence=True,
                                 className="mb-3"
                             )
                         ], md=4),
@@ -166,6 +345,7 @@ app.layout = dbc.Container([
                                 min=df['Rate / Quote Requested ($)'].min() if not df.empty else 0,
                                 max=df['Rate / Quote Requested ($)'].max() if not df.empty else 5000,
                                 step=100,
+                                updatemode='mouseup',
                                 value=[df['Rate / Quote Requested ($)'].min() if not df.empty else 0, df['Rate / Quote Requested ($)'].max() if not df.empty else 5000],
                                 marks={i: f'${i:,.0f}' for i in range(0, int(df['Rate / Quote Requested ($)'].max() if not df.empty else 5000) + 1, 1000)},
                                 className="mb-3"
@@ -375,104 +555,67 @@ app.layout = dbc.Container([
     ])
 ], fluid=True, style={'backgroundColor': '#f8f9fa', 'minHeight': '100vh'})
 
-# Helper function to apply filters
-def apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
-    if df.empty:
-        return df
-    
-    filtered_df = df.copy()
-    
-    if industry_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Industry Type'] == industry_filter]
-    
-    if shipment_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Shipment Requirement'] == shipment_filter]
-    
-    if commodity_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Product / Commodity Type'] == commodity_filter]
-    
-    if priority_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Priority Level'] == priority_filter]
-    
-    if customer_type_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Customer Type'] == customer_type_filter]
-    
-    if designation_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Designation'] == designation_filter]
-    
-    if source_country_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Source Location / Country'] == source_country_filter]
-    
-    if destination_country_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Destination Location / Country'] == destination_country_filter]
+# Helper function to compute the matching row positions (memoized per filter state)
+@cache.memoize(timeout=300)
+def filter_index(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
+    # AND together the bitmaps of the selected dropdown values (unknown values match nothing)
+    bits = np.full((len(df) + 7) // 8, 0xFF, dtype=np.uint8)
+    selections = [industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter]
+    for col, value in zip(FILTER_COLUMNS, selections):
+        if value != 'All':
+            bits &= FILTER_BITMAPS.get((col, value), 0)
+    
+    # Unpack once into a row mask and combine the range filters into it
+    mask = np.unpackbits(bits, count=len(df)).view(bool)
     
     # Rate range filter
-    filtered_df = filtered_df[
-        (filtered_df['Rate / Quote Requested ($)'] >= rate_range[0]) & 
-        (filtered_df['Rate / Quote Requested ($)'] <= rate_range[1])
-    ]
+    mask &= (RATES >= rate_range[0]) & (RATES <= rate_range[1])
     
-    # Date range filter
+    # Date range filter (rows are sorted by inquiry date, so the bounds come from a binary search)
     if start_date and end_date:
-        filtered_df = filtered_df[
-            (filtered_df['Date of Inquiry'] >= start_date) & 
-            (filtered_df['Date of Inquiry'] <= end_date)
-        ]
+        mask[:np.searchsorted(INQUIRY_DATES, np.datetime64(start_date), side='left')] = False
+        mask[np.searchsorted(INQUIRY_DATES, np.datetime64(end_date), side='right'):] = False
     
-    return filtered_df
+    return np.flatnonzero(mask)
 
-# Callback for KPI cards
+# Helper function to count rows per category code in one bincount pass (missing values are dropped)
+def count_codes(series):
+    codes = series.cat.codes.values.astype(np.intp) + 1
+    return np.bincount(codes, minlength=len(series.cat.categories) + 1)[1:]
+
+# Helper function to count values, skipping categories absent from the filtered rows
+def count_values(series):
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+# Helper function to build a single-trace chart, or patch just its trace when the layout is unchanged
+def single_trace_figure(trace, layout, patch):
+    if not patch:
+        return go.Figure(data=[trace], layout=layout)
+    fig = Patch()
+    fig['data'][0] = trace.to_plotly_json()
+    return fig
+
+# Helper function to select the rows stored in 'filtered-positions'
+def rows_at(positions):
+    return df if positions is None else df.iloc[positions]
+
+# Callback for KPI cards and charts (filters are applied once for all outputs)
 @app.callback(
     [Output('total-customers', 'children'),
      Output('avg-rate', 'children'),
      Output('total-distance', 'children'),
      Output('high-priority', 'children'),
      Output('top-industry', 'children'),
-     Output('conversion-rate', 'children')],
-    [Input('industry-filter', 'value'),
-     Input('shipment-filter', 'value'),
-     Input('commodity-filter', 'value'),
-     Input('priority-filter', 'value'),
-     Input('customer-type-filter', 'value'),
-     Input('designation-filter', 'value'),
-     Input('source-country-filter', 'value'),
-     Input('destination-country-filter', 'value'),
-     Input('rate-range-filter', 'value'),
-     Input('date-range-filter', 'start_date'),
-     Input('date-range-filter', 'end_date')]
-)
-def update_kpi_cards(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
-    if df.empty:
-        return "0", "$0.00", "0", "0", "N/A", "0%"
-    
-    filtered_df = apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date)
-    
-    # Calculate enhanced KPIs
-    total_customers = len(filtered_df)
-    avg_rate = filtered_df['Rate / Quote Requested ($)'].mean() if total_customers > 0 else 0
-    total_distance = filtered_df['Distance to be Covered (Km)'].sum() if total_customers > 0 else 0
-    high_priority = len(filtered_df[filtered_df['Priority Level'].isin(['High', 'Urgent'])]) if total_customers > 0 else 0
-    top_industry = filtered_df['Industry Type'].mode().iloc[0] if total_customers > 0 else "N/A"
-    conversion_rate = len(filtered_df[filtered_df['Status'].isin(['Closed Won', 'Negotiating'])]) / total_customers * 100 if total_customers > 0 else 0
-    
-    return (
-        f"{total_customers:,}",
-        f"${avg_rate:,.2f}",
-        f"{total_distance:,.0f}",
-        f"{high_priority}",
-        top_industry,
-        f"{conversion_rate:.1f}%"
-    )
-
-# Callback for charts
-@app.callback(
-    [Output('source-country-chart', 'figure'),
+     Output('conversion-rate', 'children'),
+     Output('source-country-chart', 'figure'),
      Output('shipment-requirements-chart', 'figure'),
      Output('industry-chart', 'figure'),
      Output('rate-chart', 'figure'),
      Output('distance-chart', 'figure'),
      Output('commodity-chart', 'figure'),
-     Output('timeline-chart', 'figure')],
+     Output('timeline-chart', 'figure'),
+     Output('filtered-positions', 'data')],
     [Input('industry-filter', 'value'),
      Input('shipment-filter', 'value'),
      Input('commodity-filter', 'value'),
@@ -485,182 +628,158 @@ def update_kpi_cards(industry_filter, shipment_filter, commodity_filter, priorit
      Input('date-range-filter', 'start_date'),
      Input('date-range-filter', 'end_date')]
 )
-def update_charts(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
+def update_dashboard(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
     if df.empty:
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        return [empty_fig] * 7
+        empty_fig = go.Figure(layout=CHART_LAYOUT)
+        return ("0", "$0.00", "0", "0", "N/A", "0%", *[empty_fig] * 7, None)
     
-    filtered_df = apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date)
+    # Filter once; the table and downloads reuse these positions through the 'filtered-positions' store
+    positions = filter_index(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, tuple(rate_range), start_date, end_date)
+    filtered_df = df.iloc[positions]
+    
+    # Patch single-trace charts in place when only the rate or date range changed
+    triggered_ids = set(callback_context.triggered_prop_ids.values())
+    patch = bool(triggered_ids) and triggered_ids <= RANGE_FILTER_IDS
+    
+    # Calculate enhanced KPIs from the raw arrays (categorical KPIs come from code counts)
+    total_customers = len(filtered_df)
+    if total_customers > 0:
+        avg_rate = filtered_df['Rate / Quote Requested ($)'].values.mean()
+        total_distance = filtered_df['Distance to be Covered (Km)'].values.sum()
+        high_priority = count_codes(filtered_df['Priority Level'])[HIGH_PRIORITY_CODES].sum()
+        top_industry = df['Industry Type'].cat.categories[count_codes(filtered_df['Industry Type']).argmax()]
+        conversion_rate = count_codes(filtered_df['Status'])[CONVERTED_STATUS_CODES].sum() / total_customers * 100
+    else:
+        avg_rate = total_distance = high_priority = conversion_rate = 0
+        top_industry = "N/A"
+    
+    # Value counts shared by the count charts
+    counts = {col: count_values(filtered_df[col]) for col in COUNT_COLUMNS}
     
     # Source Country Chart
-    source_counts = filtered_df['Source Location / Country'].value_counts()
-    source_fig = px.bar(
-        x=source_counts.values,
-        y=source_counts.index,
-        orientation='h',
-        title="",
-        color=source_counts.values,
-        color_continuous_scale='Blues'
-    )
-    source_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
+    source_counts = counts['Source Location / Country']
+    source_fig = single_trace_figure(
+        go.Bar(
+            x=source_counts.values,
+            y=source_counts.index.to_numpy(),
+            orientation='h',
+            marker=dict(color=source_counts.values, colorscale='Blues')
+        ),
+        CHART_LAYOUT_NO_LEGEND,
+        patch
     )
     
     # Shipment Requirements Chart
-    shipment_counts = filtered_df['Shipment Requirement'].value_counts()
-    shipment_fig = px.pie(
-        values=shipment_counts.values,
-        names=shipment_counts.index,
-        title=""
-    )
-    shipment_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
+    shipment_counts = counts['Shipment Requirement']
+    shipment_fig = single_trace_figure(
+        go.Pie(values=shipment_counts.values, labels=shipment_counts.index.to_numpy()),
+        CHART_LAYOUT,
+        patch
     )
     
     # Industry Chart
-    industry_counts = filtered_df['Industry Type'].value_counts()
-    industry_fig = px.bar(
-        x=industry_counts.index,
-        y=industry_counts.values,
-        title="",
-        color=industry_counts.values,
-        color_continuous_scale='Viridis'
-    )
-    industry_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
+    industry_counts = counts['Industry Type']
+    industry_fig = single_trace_figure(
+        go.Bar(
+            x=industry_counts.index.to_numpy(),
+            y=industry_counts.values,
+            marker=dict(color=industry_counts.values, colorscale='Viridis')
+        ),
+        CHART_LAYOUT_NO_LEGEND,
+        patch
     )
     
-    # Rate Chart
-    rate_fig = px.histogram(
-        filtered_df,
-        x='Rate / Quote Requested ($)',
-        title="",
-        color='Rate Category',
-        color_discrete_map={'High Value': '#28a745', 'Medium Value': '#ffc107', 'Low Value': '#dc3545'}
-    )
-    rate_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
+    # Rate Chart (binned with NumPy per rate category and stacked)
+    rate_codes = filtered_df['Rate Category'].cat.codes.values
+    filtered_rates = filtered_df['Rate / Quote Requested ($)'].values
+    bin_widths = np.diff(RATE_BIN_EDGES)
+    rate_fig = go.Figure(
+        data=[
+            go.Bar(
+                x=RATE_BIN_EDGES[:-1] + bin_widths / 2,
+                y=np.histogram(filtered_rates[rate_codes == code], bins=RATE_BIN_EDGES)[0],
+                width=bin_widths,
+                name=category,
+                marker_color=RATE_CATEGORY_COLORS[category]
+            )
+            for code, category in enumerate(df['Rate Category'].cat.categories)
+        ],
+        layout=RATE_CHART_LAYOUT
     )
     
     # Distance Chart
-    distance_fig = px.box(
-        filtered_df,
-        x='Industry Type',
-        y='Distance to be Covered (Km)',
-        title="",
-        color='Priority Level'
-    )
-    distance_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
+    distance_fig = go.Figure(
+        data=[
+            go.Box(
+                x=group['Industry Type'].values,
+                y=group['Distance to be Covered (Km)'].values,
+                name=priority,
+                offsetgroup=priority
+            )
+            for priority, group in filtered_df.groupby('Priority Level', observed=True)
+        ],
+        layout=DISTANCE_CHART_LAYOUT
     )
     
     # Commodity Chart
-    commodity_counts = filtered_df['Product / Commodity Type'].value_counts()
-    commodity_fig = px.bar(
-        x=commodity_counts.values,
-        y=commodity_counts.index,
-        orientation='h',
-        title="",
-        color=commodity_counts.values,
-        color_continuous_scale='Plasma'
-    )
-    commodity_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
+    commodity_counts = counts['Product / Commodity Type']
+    commodity_fig = single_trace_figure(
+        go.Bar(
+            x=commodity_counts.values,
+            y=commodity_counts.index.to_numpy(),
+            orientation='h',
+            marker=dict(color=commodity_counts.values, colorscale='Plasma')
+        ),
+        CHART_LAYOUT_NO_LEGEND,
+        patch
     )
     
-    # Timeline Chart
-    timeline_data = filtered_df.groupby('Date of Inquiry').size().reset_index()
-    timeline_data.columns = ['Date', 'Count']
-    timeline_fig = px.line(
-        timeline_data,
-        x='Date',
-        y='Count',
-        title="",
-        markers=True
-    )
-    timeline_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
+    # Timeline Chart (one WebGL point per day, however fine-grained the inquiry timestamps are)
+    inquiry_days, day_counts = np.unique(filtered_df['Date of Inquiry'].values.astype('datetime64[D]'), return_counts=True)
+    timeline_fig = single_trace_figure(
+        go.Scattergl(x=inquiry_days, y=day_counts, mode='lines+markers'),
+        TIMELINE_CHART_LAYOUT,
+        patch
     )
     
-    return source_fig, shipment_fig, industry_fig, rate_fig, distance_fig, commodity_fig, timeline_fig
+    return (
+        f"{total_customers:,}",
+        f"${avg_rate:,.2f}",
+        f"{total_distance:,.0f}",
+        f"{high_priority}",
+        top_industry,
+        f"{conversion_rate:.1f}%",
+        source_fig, shipment_fig, industry_fig, rate_fig, distance_fig, commodity_fig, timeline_fig,
+        None if len(positions) == len(df) else positions.tolist()
+    )
 
-# Callback for table data
-@app.callback(
+# Clientside callback for table data (picks the filtered rows out of the stored data, no extra server round-trip)
+app.clientside_callback(
+    """
+    function(positions, data) {
+        if (!data || positions === null || positions === undefined) {
+            return data || [];
+        }
+        return positions.map(i => data[i]);
+    }
+    """,
     Output('customers-table', 'data'),
-    [Input('industry-filter', 'value'),
-     Input('shipment-filter', 'value'),
-     Input('commodity-filter', 'value'),
-     Input('priority-filter', 'value'),
-     Input('customer-type-filter', 'value'),
-     Input('designation-filter', 'value'),
-     Input('source-country-filter', 'value'),
-     Input('destination-country-filter', 'value'),
-     Input('rate-range-filter', 'value'),
-     Input('date-range-filter', 'start_date'),
-     Input('date-range-filter', 'end_date')]
+    Input('filtered-positions', 'data'),
+    State('full-data', 'data')
 )
-def update_table_data(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
-    if df.empty:
-        return []
-    
-    filtered_df = apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date)
-    
-    # Prepare enhanced table data
-    table_data = filtered_df[[
-        'Customer ID', 'Company Name', 'Contact Person Name', 'Email', 'Phone',
-        'Shipment Requirement', 'Product / Commodity Type', 'Industry Type',
-        'Customer Type', 'Designation', 'Source Location / Country', 'Destination Location / Country',
-        'Distance to be Covered (Km)', 'Rate / Quote Requested ($)',
-        'Date of Inquiry', 'Priority Level', 'Status'
-    ]].to_dict('records')
-    
-    return table_data
 
 # Callback for CSV download
 @app.callback(
     Output("download-dataframe-csv", "data"),
     Input("download-btn", "n_clicks"),
-    [State('industry-filter', 'value'),
-     State('shipment-filter', 'value'),
-     State('commodity-filter', 'value'),
-     State('priority-filter', 'value'),
-     State('customer-type-filter', 'value'),
-     State('designation-filter', 'value'),
-     State('source-country-filter', 'value'),
-     State('destination-country-filter', 'value'),
-     State('rate-range-filter', 'value'),
-     State('date-range-filter', 'start_date'),
-     State('date-range-filter', 'end_date')],
+    State('filtered-positions', 'data'),
     prevent_initial_call=True,
 )
-def download_csv(n_clicks, industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
+def download_csv(n_clicks, positions):
     if df.empty or n_clicks is None:
         return None
     
-    filtered_df = apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date)
+    filtered_df = rows_at(positions)
     
     return dcc.send_data_frame(filtered_df.to_csv, "customer_intelligence.csv", index=False)
 
@@ -668,24 +787,14 @@ def download_csv(n_clicks, industry_filter, shipment_filter, commodity_filter, p
 @app.callback(
     Output("download-contacts-csv", "data"),
     Input("export-contacts-btn", "n_clicks"),
-    [State('industry-filter', 'value'),
-     State('shipment-filter', 'value'),
-     State('commodity-filter', 'value'),
-     State('priority-filter', 'value'),
-     State('customer-type-filter', 'value'),
-     State('designation-filter', 'value'),
-     State('source-country-filter', 'value'),
-     State('destination-country-filter', 'value'),
-     State('rate-range-filter', 'value'),
-     State('date-range-filter', 'start_date'),
-     State('date-range-filter', 'end_date')],
+    State('filtered-positions', 'data'),
     prevent_initial_call=True,
 )
-def download_contacts(n_clicks, industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date):
+def download_contacts(n_clicks, positions):
     if df.empty or n_clicks is None:
         return None
     
-    filtered_df = apply_filters(industry_filter, shipment_filter, commodity_filter, priority_filter, customer_type_filter, designation_filter, source_country_filter, destination_country_filter, rate_range, start_date, end_date)
+    filtered_df = rows_at(positions)
     
     # Export only contact information
     contacts_df = filtered_df[['Company Name', 'Contact Person Name', 'Email', 'Phone', 'Industry Type', 'Customer Type', 'Designation', 'Source Location / Country', 'Priority Level']]
@@ -1,7 +1,10 @@
 import os
+import re
+import functools
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import dash
 from dash import dcc, html, Input, Output, State, dash_table, callback_context
@@ -10,17 +13,54 @@ from datetime import datetime, timedelta
 import base64
 import io
 
+# Serialize figures and callback responses with orjson (Dash encodes through plotly.io.json)
+pio.json.config.default_engine = 'orjson'
+
 # Initialize the Dash app with Bootstrap theme
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 server = app.server
 
-# Load the enhanced data
+# Low-cardinality text columns stored as categoricals (filtered and counted on every callback)
+CATEGORY_COLUMNS = ['State', 'Inquiry Type', 'Industry', 'Priority Level', 'Status', 'Lead Source']
+
+# Integer measures stored in the narrowest integer dtype that holds their values
+INTEGER_COLUMNS = ['Shipments', 'Shipment Weight (lbs)', 'Shipment Value ($)']
+
+# Date columns parsed while reading the CSV
+DATE_COLUMNS = ['Inquiry Date', 'Expected Ship Date', 'Follow Up Date', 'Last Contact']
+
+# Columns shown in the leads table
+TABLE_COLUMNS = [
+    'Lead ID', 'Company Name', 'Contact Person', 'Phone Number', 'Email', 
+    'Industry', 'Inquiry Type', 'State', 'Intent Score', 'Priority Level', 
+    'Status', 'Shipment Value ($)', 'Expected Ship Date', 'Follow Up Date', 'Next Action'
+]
+
+# Table filter operators as written by the DataTable filter row (word and symbol forms)
+TABLE_FILTER_OPERATORS = {
+    'ge': 'ge', '>=': 'ge', 'le': 'le', '<=': 'le', 'lt': 'lt', '<': 'lt', 'gt': 'gt', '>': 'gt',
+    'ne': 'ne', '!=': 'ne', 'eq': 'eq', '=': 'eq', 'contains': 'contains', 'datestartswith': 'datestartswith'
+}
+
+# One table filter expression: "{column}", then the operator right after it, then the value.
+# The DataTable prefixes operators with 's' (case-sensitive) or 'i' (case-insensitive), e.g. "{State} scontains TX"
+TABLE_FILTER_PATTERN = re.compile(
+    r'\{(.+?)\}\s*([si]?)(>=|<=|!=|<|>|=|contains|datestartswith|eq|ne|lt|le|gt|ge)\s*(.*)',
+    re.DOTALL
+)
+
+# Load the enhanced data (multithreaded pyarrow parser with dtypes set up front)
 try:
-    df = pd.read_csv('data/leads.csv')
-    df['Inquiry Date'] = pd.to_datetime(df['Inquiry Date'])
-    df['Expected Ship Date'] = pd.to_datetime(df['Expected Ship Date'])
-    df['Follow Up Date'] = pd.to_datetime(df['Follow Up Date'])
-    df['Last Contact'] = pd.to_datetime(df['Last Contact'])
+    df = pd.read_csv(
+        'data/leads.csv',
+        engine='pyarrow',
+        dtype={col: 'category' for col in CATEGORY_COLUMNS},
+        parse_dates=DATE_COLUMNS
+    )
+    for col in INTEGER_COLUMNS:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    # Keep rows in inquiry date order so date ranges can be found by binary search
+    df = df.sort_values('Inquiry Date', kind='stable', ignore_index=True)
     print(f"Loaded {len(df)} comprehensive records from data/leads.csv")
 except FileNotFoundError:
     print("Error: data/leads.csv not found. Please run generate_enhanced_data.py first.")
@@ -38,21 +78,76 @@ COLORS = {
     'dark': '#343a40'
 }
 
-# Helper function to categorize intent scores
-def categorize_intent(score):
-    if score >= 0.8:
-        return 'High'
-    elif score >= 0.5:
-        return 'Medium'
-    else:
-        return 'Low'
+# Layout shared by every chart
+CHART_LAYOUT = dict(
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    margin=dict(l=20, r=20, t=20, b=20)
+)
+
+# Bar colors per intent category and priority level
+INTENT_COLORS = {'High': '#28a745', 'Medium': '#ffc107', 'Low': '#dc3545'}
+PRIORITY_COLORS = {'Urgent': '#dc3545', 'High': '#ff9800', 'Medium': '#ffc107', 'Low': '#4caf50'}
+
+# Add intent category to dataframe (side='right' keeps the thresholds inclusive: >= 0.5 is Medium, >= 0.8 is High)
+if not df.empty:
+    df['Intent Category'] = pd.Categorical.from_codes(
+        np.searchsorted([0.5, 0.8], df['Intent Score'].to_numpy(), side='right'),
+        categories=['Low', 'Medium', 'High'],
+        ordered=True
+    )
+
+# Raw column arrays reused by the filter masks
+if not df.empty:
+    INTENT_SCORES = df['Intent Score'].values
+    INQUIRY_DATES = df['Inquiry Date'].values.astype('datetime64[ns]')  # sorted ascending
+    # Full inquiry date span, used to recognize a date range that leaves every row in
+    DF_MIN_DATE = df['Inquiry Date'].min()
+    DF_MAX_DATE = df['Inquiry Date'].max()
 
-# Add intent category to dataframe
+# Table rows for the unfiltered, unsorted view, converted once so its pages are plain slices
 if not df.empty:
-    df['Intent Category'] = df['Intent Score'].apply(categorize_intent)
+    ALL_ROWS_CACHE = df[TABLE_COLUMNS].to_dict('records')
+
+# Category codes behind the High Priority and Conversion Rate KPIs
+if not df.empty:
+    HIGH_PRIORITY_CODES = [code for code, value in enumerate(df['Priority Level'].cat.categories) if value in ('High', 'Urgent')]
+    CONVERTED_STATUS_CODES = [code for code, value in enumerate(df['Status'].cat.categories) if value in ('Closed Won', 'Negotiating')]
+
+# Helper function to total a categorical column per inquiry day (rows: DAILY_DATES, columns: category codes)
+def daily_totals(column, weights=None):
+    width = len(df[column].cat.categories) + 1
+    cells = DAY_CODES * width + df[column].cat.codes.values.astype(np.intp) + 1
+    return np.bincount(cells, weights=weights, minlength=len(DAILY_DATES) * width).reshape(-1, width)[:, 1:]
+
+# Per-day pivots behind the count charts, sliced instead of regrouped when only the date range filters rows
+if not df.empty:
+    DAILY_DATES, DAY_CODES = np.unique(INQUIRY_DATES, return_inverse=True)
+    DAILY_COUNTS = np.bincount(DAY_CODES, minlength=len(DAILY_DATES))
+    DAILY_STATE_COUNTS = daily_totals('State')
+    DAILY_STATE_SHIPMENTS = daily_totals('State', df['Shipments'].values)
+    DAILY_INDUSTRY_COUNTS = daily_totals('Industry')
+    DAILY_PRIORITY_COUNTS = daily_totals('Priority Level')
+    DAILY_SOURCE_COUNTS = daily_totals('Lead Source')
+
+# Helper function to build dropdown options from a categorical column
+def build_options(column, all_label):
+    options = [{'label': all_label, 'value': 'All'}]
+    if not df.empty:
+        options += [{'label': value, 'value': value} for value in sorted(df[column].cat.categories)]
+    return options
+
+# Dropdown options, computed once at startup
+STATE_OPTIONS = build_options('State', 'All States')
+INQUIRY_TYPE_OPTIONS = build_options('Inquiry Type', 'All Types')
+INDUSTRY_OPTIONS = build_options('Industry', 'All Industries')
+PRIORITY_OPTIONS = build_options('Priority Level', 'All Priorities')
 
 # Define the enhanced layout
 app.layout = dbc.Container([
+    # Row positions matching the current filters, written by the dashboard callback (None when every row matches)
+    dcc.Store(id='filtered-positions'),
+    
     # Header Section
     dbc.Row([
         dbc.Col([
@@ -82,8 +177,7 @@ app.layout = dbc.Container([
                             html.Label("State:", className="form-label"),
                             dcc.Dropdown(
                                 id='state-filter',
-                                options=[{'label': 'All States', 'value': 'All'}] + 
-                                       [{'label': state, 'value': state} for state in sorted(df['State'].unique()) if not df.empty],
+                                options=STATE_OPTIONS,
                                 value='All',
                                 className="mb-3"
                             )
@@ -92,8 +186,7 @@ app.layout = dbc.Container([
                             html.Label("Inquiry Type:", className="form-label"),
                             dcc.Dropdown(
                                 id='inquiry-type-filter',
-                                options=[{'label': 'All Types', 'value': 'All'}] + 
-                                       [{'label': itype, 'value': itype} for itype in sorted(df['Inquiry Type'].unique()) if not df.empty],
+                                options=INQUIRY_TYPE_OPTIONS,
                                 value='All',
                                 className="mb-3"
                             )
@@ -102,8 +195,7 @@ app.layout = dbc.Container([
                             html.Label("Industry:", className="form-label"),
                             dcc.Dropdown(
                                 id='industry-filter',
-                                options=[{'label': 'All Industries', 'value': 'All'}] + 
-                                       [{'label': industry, 'value': industry} for industry in sorted(df['Industry'].unique()) if not df.empty],
+                                options=INDUSTRY_OPTIONS,
                                 value='All',
                                 className="mb-3"
                             )
@@ -112,8 +204,7 @@ app.layout = dbc.Container([
                             html.Label("Priority Level:", className="form-label"),
                             dcc.Dropdown(
                                 id='priority-filter',
-                                options=[{'label': 'All Priorities', 'value': 'All'}] + 
-                                       [{'label': priority, 'value': priority} for priority in sorted(df['Priority Level'].unique()) if not df.empty],
+                                options=PRIORITY_OPTIONS,
                                 value='All',
                                 className="mb-3"
                             )
@@ -308,7 +399,9 @@ app.layout = dbc.Container([
                             {'name': 'Next Action', 'id': 'Next Action'}
                         ],
                         data=[],
+                        page_current=0,
                         page_size=15,
+                        page_action='custom',
                         style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '12px'},
                         style_header={'backgroundColor': COLORS['primary'], 'color': 'white', 'fontWeight': 'bold'},
                         style_data_conditional=[
@@ -328,9 +421,11 @@ app.layout = dbc.Container([
                                 'fontWeight': 'bold'
                             }
                         ],
-                        filter_action="native",
-                        sort_action="native",
-                        export_format="csv"
+                        filter_action='custom',
+                        filter_query='',
+                        sort_action='custom',
+                        sort_mode='single',
+                        sort_by=[]
                     )
                 ])
             ])
@@ -338,115 +433,117 @@ app.layout = dbc.Container([
     ])
 ], fluid=True, style={'backgroundColor': '#f8f9fa', 'minHeight': '100vh'})
 
-# Helper function to apply filters
-def apply_filters(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
-    if df.empty:
-        return df
+# Helper function to compute the row positions matching the filters (cached per filter combination, None when nothing is filtered out)
+@functools.lru_cache(maxsize=256)
+def _filter_indices(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_low, intent_high, start_date, end_date):
+    # Every filter at its default leaves all rows in, so skip building the mask
+    dates_cover_all = not (start_date and end_date) or (pd.Timestamp(start_date) <= DF_MIN_DATE and pd.Timestamp(end_date) >= DF_MAX_DATE)
+    if (state_filter, inquiry_type_filter, industry_filter, priority_filter) == ('All',) * 4 and intent_low <= 0 and intent_high >= 1 and dates_cover_all:
+        return None
     
-    filtered_df = df.copy()
+    # Combine every filter into one boolean mask so the frame is indexed only once
+    mask = np.ones(len(df), dtype=bool)
     
     if state_filter != 'All':
-        filtered_df = filtered_df[filtered_df['State'] == state_filter]
+        mask &= (df['State'].values == state_filter)
     
     if inquiry_type_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Inquiry Type'] == inquiry_type_filter]
+        mask &= (df['Inquiry Type'].values == inquiry_type_filter)
     
     if industry_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Industry'] == industry_filter]
+        mask &= (df['Industry'].values == industry_filter)
     
     if priority_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Priority Level'] == priority_filter]
+        mask &= (df['Priority Level'].values == priority_filter)
     
     # Intent range filter
-    filtered_df = filtered_df[
-        (filtered_df['Intent Score'] >= intent_range[0]) & 
-        (filtered_df['Intent Score'] <= intent_range[1])
-    ]
+    mask &= (INTENT_SCORES >= intent_low) & (INTENT_SCORES <= intent_high)
     
-    # Date range filter
+    # Date range filter (rows are sorted by inquiry date, so the bounds come from a binary search)
     if start_date and end_date:
-        filtered_df = filtered_df[
-            (filtered_df['Inquiry Date'] >= start_date) & 
-            (filtered_df['Inquiry Date'] <= end_date)
-        ]
+        mask[:np.searchsorted(INQUIRY_DATES, np.datetime64(start_date), side='left')] = False
+        mask[np.searchsorted(INQUIRY_DATES, np.datetime64(end_date), side='right'):] = False
     
-    return filtered_df
+    return np.flatnonzero(mask)
+
+# Helper function to count rows (or total weights) per category code in one bincount pass (missing values are dropped)
+def count_codes(series, weights=None):
+    codes = series.cat.codes.values.astype(np.intp) + 1
+    return np.bincount(codes, weights=weights, minlength=len(series.cat.categories) + 1)[1:]
+
+# Helper function to count values, skipping categories absent from the filtered rows
+def count_values(series):
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+# Helper function to put per-code counts in value_counts order, skipping categories with no rows
+def counts_by_category(column, counts):
+    counts = pd.Series(counts, index=df[column].cat.categories).sort_values(ascending=False)
+    return counts[counts > 0]
+
+# Helper function to list the category codes present, in order of first appearance (so trace order and colors follow the rows)
+def codes_in_order(codes):
+    present, first_rows = np.unique(codes, return_index=True)
+    ordered = present[np.argsort(first_rows)]
+    return ordered[ordered >= 0]
+
+# Helper function to select rows by position (None selects every row)
+def rows_at(positions):
+    return df if positions is None else df.iloc[positions]
+
+# Helper function to apply one table filter expression (e.g. "{State} contains TX" or "{Intent Score} >= 0.8")
+def filter_table(table_df, filter_part):
+    # Parse the expression structurally so operator words inside the value (e.g. "Malone") are left alone
+    match = TABLE_FILTER_PATTERN.match(filter_part.strip())
+    if match is None:
+        return table_df
+    column, case, operator, value = match.groups()
+    operator = TABLE_FILTER_OPERATORS[operator]
+    if column not in table_df.columns:
+        return table_df
+    ignore_case = case == 'i'
+    
+    value = value.strip()
+    if len(value) > 1 and value[0] == value[-1] and value[0] in ('"', "'", '`'):
+        value = value[1:-1].replace('\\' + value[0], value[0])
+    
+    series = table_df[column]
+    if operator in ('contains', 'datestartswith'):
+        text = series.astype(str)
+        if operator == 'contains':
+            return table_df[text.str.contains(value, case=not ignore_case, regex=False)]
+        if ignore_case:
+            text, value = text.str.lower(), value.lower()
+        return table_df[text.str.startswith(value)]
+    
+    # Numeric columns compare as numbers, everything else as the text shown in the table
+    if pd.api.types.is_numeric_dtype(series):
+        try:
+            value = float(value)
+        except ValueError:
+            return table_df.iloc[:0]
+    else:
+        series = series.astype(str)
+        if ignore_case:
+            series, value = series.str.lower(), value.lower()
+    return table_df[getattr(series, operator)(value)]
 
-# Callback for KPI cards
+# Callback for KPI cards and charts (filters are applied once for all outputs)
 @app.callback(
     [Output('total-leads', 'children'),
      Output('avg-intent', 'children'),
      Output('total-value', 'children'),
      Output('high-priority', 'children'),
      Output('top-industry', 'children'),
-     Output('conversion-rate', 'children')],
-    [Input('state-filter', 'value'),
-     Input('inquiry-type-filter', 'value'),
-     Input('industry-filter', 'value'),
-     Input('priority-filter', 'value'),
-     Input('intent-range-filter', 'value'),
-     Input('date-range-filter', 'start_date'),
-     Input('date-range-filter', 'end_date')]
-)
-def update_kpi_cards(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
-    if df.empty:
-        return "0", "0.00", "$0", "0", "N/A", "0%"
-    
-    filtered_df = apply_filters(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date)
-    
-    # Calculate enhanced KPIs
-    total_leads = len(filtered_df)
-    avg_intent = filtered_df['Intent Score'].mean() if total_leads > 0 else 0
-    total_value = filtered_df['Shipment Value ($)'].sum() if total_leads > 0 else 0
-    high_priority = len(filtered_df[filtered_df['Priority Level'].isin(['High', 'Urgent'])]) if total_leads > 0 else 0
-    top_industry = filtered_df['Industry'].mode().iloc[0] if total_leads > 0 else "N/A"
-    conversion_rate = len(filtered_df[filtered_df['Status'].isin(['Closed Won', 'Negotiating'])]) / total_leads * 100 if total_leads > 0 else 0
-    
-    return (
-        f"{total_leads:,}",
-        f"{avg_intent:.2f}",
-        f"${total_value:,.0f}",
-        f"{high_priority}",
-        top_industry,
-        f"{conversion_rate:.1f}%"
-    )
-
-# Callback for trend indicators
-@app.callback(
-    [Output('leads-change', 'children'),
-     Output('intent-change', 'children'),
-     Output('value-change', 'children'),
-     Output('priority-change', 'children'),
-     Output('industry-change', 'children'),
-     Output('conversion-change', 'children')],
-    [Input('state-filter', 'value'),
-     Input('inquiry-type-filter', 'value'),
-     Input('industry-filter', 'value'),
-     Input('priority-filter', 'value'),
-     Input('intent-range-filter', 'value'),
-     Input('date-range-filter', 'start_date'),
-     Input('date-range-filter', 'end_date')]
-)
-def update_trend_indicators(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
-    import random
-    return (
-        f"↗ +{random.randint(5, 15)}% vs last month",
-        f"↗ +{random.randint(2, 8)}% vs last month",
-        f"↗ +{random.randint(10, 25)}% vs last month",
-        f"↗ +{random.randint(3, 12)}% vs last month",
-        f"↗ +{random.randint(5, 20)}% vs last month",
-        f"↗ +{random.randint(1, 5)}% vs last month"
-    )
-
-# Callback for charts
-@app.callback(
-    [Output('load-origins-chart', 'figure'),
+     Output('conversion-rate', 'children'),
+     Output('load-origins-chart', 'figure'),
      Output('intent-distribution-chart', 'figure'),
      Output('industry-chart', 'figure'),
      Output('priority-chart', 'figure'),
      Output('source-chart', 'figure'),
      Output('value-chart', 'figure'),
-     Output('timeline-chart', 'figure')],
+     Output('timeline-chart', 'figure'),
+     Output('filtered-positions', 'data')],
     [Input('state-filter', 'value'),
      Input('inquiry-type-filter', 'value'),
      Input('industry-filter', 'value'),
@@ -455,131 +552,175 @@ def update_trend_indicators(state_filter, inquiry_type_filter, industry_filter,
      Input('date-range-filter', 'start_date'),
      Input('date-range-filter', 'end_date')]
 )
-def update_charts(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
+def update_dashboard(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
     if df.empty:
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        return [empty_fig] * 7
-    
-    filtered_df = apply_filters(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date)
-    
-    # Load Origins by State Chart
-    state_counts = filtered_df.groupby('State')['Shipments'].sum().reset_index()
-    load_origins_fig = px.bar(
-        state_counts, 
-        x='State', 
-        y='Shipments',
-        title="",
-        color='Shipments',
-        color_continuous_scale='Blues'
-    )
-    load_origins_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+        empty_fig = go.Figure(layout=CHART_LAYOUT)
+        return ("0", "0.00", "$0", "0", "N/A", "0%", *[empty_fig] * 7, None)
     
-    # Intent Distribution Chart
-    intent_dist_fig = px.histogram(
-        filtered_df,
-        x='Intent Category',
-        title="",
-        color='Intent Category',
-        color_discrete_map={'High': '#28a745', 'Medium': '#ffc107', 'Low': '#dc3545'}
-    )
-    intent_dist_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+    # Filter once; the downloads reuse these positions through the 'filtered-positions' store
+    positions = _filter_indices(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range[0], intent_range[1], start_date, end_date)
+    filtered_df = rows_at(positions)
+    
+    # Calculate enhanced KPIs from the raw arrays (categorical KPIs come from code counts)
+    total_leads = len(filtered_df)
+    if total_leads > 0:
+        avg_intent = filtered_df['Intent Score'].values.mean()
+        total_value = filtered_df['Shipment Value ($)'].values.sum()
+        high_priority = count_codes(filtered_df['Priority Level'])[HIGH_PRIORITY_CODES].sum()
+        top_industry = df['Industry'].cat.categories[count_codes(filtered_df['Industry']).argmax()]
+        conversion_rate = count_codes(filtered_df['Status'])[CONVERTED_STATUS_CODES].sum() / total_leads * 100
+    else:
+        avg_intent = total_value = high_priority = conversion_rate = 0
+        top_industry = "N/A"
+    
+    # Chart aggregates: slice the per-day pivots when only the date range filters rows, otherwise group the filtered rows
+    if (state_filter, inquiry_type_filter, industry_filter, priority_filter) == ('All',) * 4 and intent_range[0] <= 0 and intent_range[1] >= 1:
+        days = slice(0, len(DAILY_DATES))
+        if start_date and end_date:
+            days = slice(
+                np.searchsorted(DAILY_DATES, np.datetime64(start_date), side='left'),
+                np.searchsorted(DAILY_DATES, np.datetime64(end_date), side='right')
+            )
+        state_rows = DAILY_STATE_COUNTS[days].sum(axis=0)
+        state_shipments = DAILY_STATE_SHIPMENTS[days].sum(axis=0)
+        industry_counts = counts_by_category('Industry', DAILY_INDUSTRY_COUNTS[days].sum(axis=0))
+        priority_counts = counts_by_category('Priority Level', DAILY_PRIORITY_COUNTS[days].sum(axis=0))
+        source_counts = counts_by_category('Lead Source', DAILY_SOURCE_COUNTS[days].sum(axis=0))
+        day_counts = DAILY_COUNTS[days]
+        timeline_counts = pd.Series(day_counts[day_counts > 0], index=DAILY_DATES[days][day_counts > 0])
+    else:
+        state_rows = count_codes(filtered_df['State'])
+        state_shipments = count_codes(filtered_df['State'], filtered_df['Shipments'].values)
+        industry_counts = count_values(filtered_df['Industry'])
+        priority_counts = count_values(filtered_df['Priority Level'])
+        source_counts = count_values(filtered_df['Lead Source'])
+        timeline_counts = filtered_df.groupby('Inquiry Date').size()
+    
+    # Load Origins by State Chart (states with at least one filtered lead)
+    states_present = state_rows > 0
+    state_shipments = state_shipments[states_present].astype(np.int64)
+    load_origins_fig = go.Figure(go.Bar(
+        x=df['State'].cat.categories[states_present].to_numpy(),
+        y=state_shipments,
+        marker=dict(color=state_shipments, colorscale='Blues', colorbar=dict(title='Shipments'))
+    ))
+    load_origins_fig.update_layout(CHART_LAYOUT, showlegend=False, xaxis_title='State', yaxis_title='Shipments')
+    
+    # Intent Distribution Chart (three pre-binned bars instead of a histogram over every row)
+    intent_counts = pd.Series(count_codes(filtered_df['Intent Category']), index=df['Intent Category'].cat.categories)
+    intent_counts = intent_counts.reindex(['High', 'Medium', 'Low'], fill_value=0)
+    intent_dist_fig = go.Figure(go.Bar(
+        x=intent_counts.index.to_numpy(),
+        y=intent_counts.values.astype(np.int64),
+        marker_color=[INTENT_COLORS[category] for category in intent_counts.index]
+    ))
+    intent_dist_fig.update_layout(CHART_LAYOUT, showlegend=False, xaxis_title='Intent Category', yaxis_title='count')
     
     # Industry Breakdown Chart
-    industry_counts = filtered_df['Industry'].value_counts()
-    industry_fig = px.pie(
-        values=industry_counts.values,
-        names=industry_counts.index,
-        title=""
-    )
-    industry_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+    industry_fig = go.Figure(go.Pie(labels=industry_counts.index.to_numpy(), values=industry_counts.values))
+    industry_fig.update_layout(CHART_LAYOUT)
     
     # Priority Level Chart
-    priority_counts = filtered_df['Priority Level'].value_counts()
-    priority_fig = px.bar(
-        x=priority_counts.index,
+    priority_fig = go.Figure(go.Bar(
+        x=priority_counts.index.to_numpy(),
         y=priority_counts.values,
-        title="",
-        color=priority_counts.index,
-        color_discrete_map={'Urgent': '#dc3545', 'High': '#ff9800', 'Medium': '#ffc107', 'Low': '#4caf50'}
-    )
-    priority_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+        marker_color=[PRIORITY_COLORS.get(level, COLORS['secondary']) for level in priority_counts.index]
+    ))
+    priority_fig.update_layout(CHART_LAYOUT, showlegend=False)
     
     # Lead Source Chart
-    source_counts = filtered_df['Lead Source'].value_counts()
-    source_fig = px.bar(
+    source_fig = go.Figure(go.Bar(
         x=source_counts.values,
-        y=source_counts.index,
+        y=source_counts.index.to_numpy(),
         orientation='h',
-        title="",
-        color=source_counts.values,
-        color_continuous_scale='Viridis'
-    )
-    source_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+        marker=dict(color=source_counts.values, colorscale='Viridis', showscale=True)
+    ))
+    source_fig.update_layout(CHART_LAYOUT, showlegend=False)
+    
+    # Shipment Value Analysis (one box trace per priority level, boxes only, without an SVG marker per outlier)
+    priority_codes = filtered_df['Priority Level'].cat.codes.values
+    industries = filtered_df['Industry'].to_numpy()
+    shipment_values = filtered_df['Shipment Value ($)'].values
+    priority_levels = df['Priority Level'].cat.categories
+    value_fig = go.Figure([
+        go.Box(x=industries[priority_codes == code], y=shipment_values[priority_codes == code], name=priority_levels[code], boxpoints=False)
+        for code in codes_in_order(priority_codes)
+    ])
+    value_fig.update_layout(CHART_LAYOUT, boxmode='group', legend_title_text='Priority Level', xaxis_title='Industry', yaxis_title='Shipment Value ($)')
     
-    # Shipment Value Analysis
-    value_fig = px.box(
-        filtered_df,
-        x='Industry',
-        y='Shipment Value ($)',
-        title="",
-        color='Priority Level'
-    )
-    value_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+    # Timeline Analysis (WebGL trace)
+    timeline_fig = go.Figure(go.Scattergl(x=timeline_counts.index, y=timeline_counts.values, mode='lines+markers'))
+    timeline_fig.update_layout(CHART_LAYOUT, xaxis_title='Date', yaxis_title='Count')
     
-    # Timeline Analysis
-    timeline_data = filtered_df.groupby('Inquiry Date').size().reset_index()
-    timeline_data.columns = ['Date', 'Count']
-    timeline_fig = px.line(
-        timeline_data,
-        x='Date',
-        y='Count',
-        title="",
-        markers=True
-    )
-    timeline_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        margin=dict(l=20, r=20, t=20, b=20)
+    return (
+        f"{total_leads:,}",
+        f"{avg_intent:.2f}",
+        f"${total_value:,.0f}",
+        f"{high_priority}",
+        top_industry,
+        f"{conversion_rate:.1f}%",
+        load_origins_fig, intent_dist_fig, industry_fig, priority_fig, source_fig, value_fig, timeline_fig,
+        None if positions is None or len(positions) == len(df) else positions.tolist()
     )
-    
-    return load_origins_fig, intent_dist_fig, industry_fig, priority_fig, source_fig, value_fig, timeline_fig
 
-# Callback for table data
+# Callback for the leads table (paging, sorting and column filters run here so only the visible page is sent)
 @app.callback(
-    Output('leads-table', 'data'),
+    [Output('leads-table', 'data'),
+     Output('leads-table', 'page_count'),
+     Output('leads-table', 'page_current')],
+    [Input('filtered-positions', 'data'),
+     Input('leads-table', 'page_current'),
+     Input('leads-table', 'page_size'),
+     Input('leads-table', 'sort_by'),
+     Input('leads-table', 'filter_query')]
+)
+def update_table(positions, page_current, page_size, sort_by, filter_query):
+    if df.empty:
+        return [], 1, 0
+    
+    # Nothing filtered or sorted: page straight out of the precomputed rows
+    if positions is None and not filter_query and not sort_by:
+        table_df = None
+        row_count = len(ALL_ROWS_CACHE)
+    else:
+        table_df = rows_at(positions)[TABLE_COLUMNS]
+        
+        for filter_part in (filter_query or '').split(' && '):
+            table_df = filter_table(table_df, filter_part)
+        
+        if sort_by:
+            table_df = table_df.sort_values(
+                [col['column_id'] for col in sort_by],
+                ascending=[col['direction'] == 'asc' for col in sort_by],
+                kind='stable'
+            )
+        row_count = len(table_df)
+    
+    # A new filter or sort starts again from the first page
+    page_count = max(1, -(-row_count // page_size))
+    if 'leads-table.page_current' not in callback_context.triggered_prop_ids:
+        page_current = 0
+    page_current = min(page_current or 0, page_count - 1)
+    
+    start = page_current * page_size
+    if table_df is None:
+        return ALL_ROWS_CACHE[start:start + page_size], page_count, page_current
+    return table_df.iloc[start:start + page_size].to_dict('records'), page_count, page_current
+
+# Clientside callback for trend indicators (the figures are illustrative, so no server round-trip is needed)
+app.clientside_callback(
+    """
+    function(state, inquiryType, industry, priority, intentRange, startDate, endDate) {
+        const ranges = [[5, 15], [2, 8], [10, 25], [3, 12], [5, 20], [1, 5]];
+        return ranges.map(([low, high]) => `↗ +${low + Math.floor(Math.random() * (high - low + 1))}% vs last month`);
+    }
+    """,
+    [Output('leads-change', 'children'),
+     Output('intent-change', 'children'),
+     Output('value-change', 'children'),
+     Output('priority-change', 'children'),
+     Output('industry-change', 'children'),
+     Output('conversion-change', 'children')],
     [Input('state-filter', 'value'),
      Input('inquiry-type-filter', 'value'),
      Input('industry-filter', 'value'),
@@ -588,63 +729,20 @@ def update_charts(state_filter, inquiry_type_filter, industry_filter, priority_f
      Input('date-range-filter', 'start_date'),
      Input('date-range-filter', 'end_date')]
 )
-def update_table_data(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
-    if df.empty:
-        return []
-    
-    filtered_df = apply_filters(state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date)
-    
-    # Prepare enhanced table data
-    table_data = filtered_df[[
-        'Lead ID', 'Company Name', 'Contact Person', 'Phone Number', 'Email', 
-        'Industry', 'Inquiry Type', 'State', 'Intent Score', 'Priority Level', 
-        'Status', 'Shipment Value ($)', 'Expected Ship Date', 'Follow Up Date', 'Next Action'
-    ]].to_dict('records')
-    
-    return table_data
 
 # Callback for CSV download
 @app.callback(
     Output("download-dataframe-csv", "data"),
     Input("download-btn", "n_clicks"),
-    [State('state-filter', 'value'),
-     State('inquiry-type-filter', 'value'),
-     State('industry-filter', 'value'),
-     State('priority-filter', 'value'),
-     State('intent-range-filter', 'value'),
-     State('date-range-filter', 'start_date'),
-     State('date-range-filter', 'end_date')],
+    State('filtered-positions', 'data'),
     prevent_initial_call=True,
 )
-def download_csv(n_clicks, state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
+def download_csv(n_clicks, positions):
     if df.empty or n_clicks is None:
         return None
     
-    # Apply same filters as dashboard
-    filtered_df = df.copy()
-    
-    if state_filter != 'All':
-        filtered_df = filtered_df[filtered_df['State'] == state_filter]
-    
-    if inquiry_type_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Inquiry Type'] == inquiry_type_filter]
-    
-    if industry_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Industry'] == industry_filter]
-    
-    if priority_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Priority Level'] == priority_filter]
-    
-    filtered_df = filtered_df[
-        (filtered_df['Intent Score'] >= intent_range[0]) & 
-        (filtered_df['Intent Score'] <= intent_range[1])
-    ]
-    
-    if start_date and end_date:
-        filtered_df = filtered_df[
-            (filtered_df['Inquiry Date'] >= start_date) & 
-            (filtered_df['Inquiry Date'] <= end_date)
-        ]
+    # Reuse the rows the dashboard filtered
+    filtered_df = rows_at(positions)
     
     return dcc.send_data_frame(filtered_df.to_csv, "comprehensive_leads.csv", index=False)
 
@@ -652,49 +750,26 @@ def download_csv(n_clicks, state_filter, inquiry_type_filter, industry_filter, p
 @app.callback(
     Output("download-contacts-csv", "data"),
     Input("export-contacts-btn", "n_clicks"),
-    [State('state-filter', 'value'),
-     State('inquiry-type-filter', 'value'),
-     State('industry-filter', 'value'),
-     State('priority-filter', 'value'),
-     State('intent-range-filter', 'value'),
-     State('date-range-filter', 'start_date'),
-     State('date-range-filter', 'end_date')],
+    State('filtered-positions', 'data'),
     prevent_initial_call=True,
 )
-def download_contacts(n_clicks, state_filter, inquiry_type_filter, industry_filter, priority_filter, intent_range, start_date, end_date):
+def download_contacts(n_clicks, positions):
     if df.empty or n_clicks is None:
         return None
     
-    # Apply same filters as dashboard
-    filtered_df = df.copy()
-    
-    if state_filter != 'All':
-        filtered_df = filtered_df[filtered_df['State'] == state_filter]
-    
-    if inquiry_type_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Inquiry Type'] == inquiry_type_filter]
+    # Reuse the rows the dashboard filtered
+    filtered_df = rows_at(positions)
     
-    if industry_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Industry'] == industry_filter]
-    
-    if priority_filter != 'All':
-        filtered_df = filtered_df[filtered_df['Priority Level'] == priority_filter]
-    
-    filtered_df = filtered_df[
-        (filtered_df['Intent Score'] >= intent_range[0]) & 
-        (filtered_df['Intent Score'] <= intent_range[1])
-    ]
-    
-    if start_date and end_date:
-        filtered_df = filtered_df[
-            (filtered_df['Inquiry Date'] >= start_date) & 
-            (filtered_df['Inquiry Date'] <= end_date)
-        ]
-    
-    # Export only contact information
-    contacts_df = filtered_df[['Company Name', 'Contact Person', 'Phone Number', 'Email', 'Industry', 'State', 'Priority Level']]
-    return dcc.send_data_frame(contacts_df.to_csv, "contact_list.csv", index=False)
+    # Export only contact information (to_csv picks the columns itself, so no subset frame is copied)
+    return dcc.send_data_frame(
+        filtered_df.to_csv,
+        "contact_list.csv",
+        index=False,
+        columns=['Company Name', 'Contact Person', 'Phone Number', 'Email', 'Industry', 'State', 'Priority Level']
+    )
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 8050))
-    app.run_server(host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
+    # Debug mode (hot reload, dev tools) is opt-in; production runs under gunicorn via app:server
+    debug = os.environ.get("DASH_DEBUG", "0") == "1"
+    app.run_server(host="0.0.0.0", port=port, debug=debug, threaded=True)
\ No newline at end of file